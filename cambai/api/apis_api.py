@@ -78,8 +78,26 @@ class CambAI:
             if configuration.api_key['APIKeyHeader'] is None:
                 raise ValueError("API key not provided. Please provide api_key or set CAMB_API_KEY environment variable.")
             api_client = ApiClient(configuration=configuration)
+            self._owns_api_client = True
+        else:
+            self._owns_api_client = False
         self.api_client = api_client
 
+    def __enter__(self) -> "CambAI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Clear the urllib3 connection pool of the ApiClient this client created.
+
+        The client stays usable afterwards and reconnects lazily on the next call.
+        A caller-supplied ``api_client`` may be shared, so its pool is left alone.
+        """
+        if self._owns_api_client:
+            self.api_client.rest_client.pool_manager.clear()
+
     @validate_call
     def text_to_sound(
         self,
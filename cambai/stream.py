@@ -2,9 +2,29 @@ import typing
 import shutil
 import subprocess
 
+_BINARY_PATHS: typing.Dict[str, str] = {}
+_STREAM_BUFSIZE = 1024
 
-def stream(audio_stream: typing.Iterator[bytes]) -> bytes:
-    if shutil.which("gst-play-1.0") is None:
+
+def _which(binary: str) -> typing.Optional[str]:
+    # Resolve each gstreamer binary once instead of walking $PATH on every call.
+    # Misses are not cached so installing gstreamer later still works.
+    path = _BINARY_PATHS.get(binary)
+    if path is None:
+        path = shutil.which(binary)
+        if path is not None:
+            _BINARY_PATHS[binary] = path
+    return path
+
+
+def stream_iter(audio_stream: typing.Iterator[bytes]) -> typing.Iterator[bytes]:
+    """Play an audio stream through `gst-play-1.0`, yielding each chunk once written.
+
+    Nothing is accumulated, so playback uses O(chunk) memory regardless of stream
+    length while callers can still inspect the chunks as they pass through.
+    """
+    gst_play_path = _which("gst-play-1.0")
+    if gst_play_path is None:
         message = (
             "Audio streaming requires `gst-play-1.0`, but it was not found on your system."
             "On macOS, type `brew install gstreamer` to install it."
@@ -12,28 +32,64 @@ def stream(audio_stream: typing.Iterator[bytes]) -> bytes:
         )
         raise ValueError(message)
 
-    gst_play_command = ["gst-play-1.0", "--no-interactive", "fd://0"]
+    gst_play_command = [gst_play_path, "--no-interactive", "fd://0"]
     gst_play_process = subprocess.Popen(
         gst_play_command,
+        # Coalesce tiny chunks into fewer writes while holding back at most 1 KiB of
+        # audio: ~250 ms at 32 kbps, ~30 ms at 256 kbps. Larger chunks bypass the buffer.
+        bufsize=_STREAM_BUFSIZE,
         stdin=subprocess.PIPE,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
 
-    audio = b""
-    for chunk in audio_stream:
-        if chunk is not None:
+    # Writes block while the pipe is full, which is the backpressure we want. If
+    # gst-play exits, BrokenPipeError only surfaces once the stdin buffer spills
+    # (within 1 KiB) or at close(), which is tolerated in the cleanup below.
+    try:
+        for chunk in filter(None, audio_stream):  # Skip None/empty chunks once, up front
             gst_play_process.stdin.write(chunk)
-            gst_play_process.stdin.flush()
-            audio += chunk
-    if gst_play_process.stdin:
-        gst_play_process.stdin.close()
-    gst_play_process.wait()
-    return audio
+            yield chunk
+    finally:
+        if gst_play_process.stdin:
+            try:
+                gst_play_process.stdin.close()
+            except BrokenPipeError:
+                pass  # gst-play already exited; still reap it below
+        gst_play_process.wait()
+
+
+@typing.overload
+def stream(audio_stream: typing.Iterator[bytes], accumulate: typing.Literal[True] = ...) -> bytes: ...
+
+
+@typing.overload
+def stream(audio_stream: typing.Iterator[bytes], accumulate: typing.Literal[False]) -> None: ...
 
 
-def capture(sample_rate=16000) -> typing.Iterator[bytes]:
-    if shutil.which("gst-launch-1.0") is None:
+@typing.overload
+def stream(audio_stream: typing.Iterator[bytes], accumulate: bool) -> typing.Optional[bytes]: ...
+
+
+def stream(audio_stream: typing.Iterator[bytes], accumulate: bool = True) -> typing.Optional[bytes]:
+    """Play an audio stream through `gst-play-1.0` and return the full audio.
+
+    Pass ``accumulate=False`` for playback only: ``None`` is returned and memory
+    stays flat regardless of stream length (see also `stream_iter`).
+    """
+    if accumulate:
+        return b"".join(stream_iter(audio_stream))  # Single allocation instead of one copy per chunk
+    for _ in stream_iter(audio_stream):
+        pass
+    return None
+
+
+def capture(sample_rate=16000, chunk_ms: int = 100) -> typing.Iterator[bytes]:
+    if chunk_ms <= 0:
+        raise ValueError(f"chunk_ms must be positive, got {chunk_ms}")
+
+    gst_launch_path = _which("gst-launch-1.0")
+    if gst_launch_path is None:
         message = (
             "Audio capture requires `gst-launch-1.0`, but it was not found on your system."
             "On macOS, type `brew install gstreamer` to install it."
@@ -42,27 +98,45 @@ def capture(sample_rate=16000) -> typing.Iterator[bytes]:
         raise ValueError(message)
 
     gst_launch_command = [
-        "gst-launch-1.0",
+        gst_launch_path,
         "autoaudiosrc", "!",
         "audioconvert", "!", "audioresample", "!",
-        f"audio/x-raw,format=S16LE,rate={sample_rate}", "!",
+        f"audio/x-raw,format=S16LE,rate={sample_rate},channels=1", "!",
         "fdsink", "fd=1"
     ]
-    
+
+    # Size reads to roughly `chunk_ms` of audio, rounded up to whole S16LE mono frames
+    frame_bytes = 2
+    chunk_size = max(frame_bytes, (sample_rate * frame_bytes * chunk_ms) // 1000)
+    chunk_size = -(-chunk_size // frame_bytes) * frame_bytes
+
     process = subprocess.Popen(
         gst_launch_command,
+        bufsize=chunk_size,
         stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
         universal_newlines=False  # Read bytes, not text
     )
     
+    leftover = b""
     try:
         while True:
-            chunk = process.stdout.read(16384) # Read approx. half a second at a time
+            # read1 returns whatever is available (up to `chunk_size`) instead of
+            # blocking until a full chunk has arrived
+            chunk = process.stdout.read1(chunk_size)
             if not chunk:
                 break  # EOS
-            yield chunk  # Yield the chunk of audio data
+            # A short read may split a frame; carry the partial frame into the next yield
+            if leftover:
+                chunk = leftover + chunk
+            tail = len(chunk) % frame_bytes
+            if tail:
+                chunk, leftover = chunk[:-tail], chunk[-tail:]
+            else:
+                leftover = b""
+            if chunk:
+                yield chunk  # Yield the chunk of audio data
     finally:
         process.stdout.close()
         process.wait()
\ No newline at end of file